@@ -1,5 +1,7 @@
 """CheckResult type alias for type hint validation results."""
-from typing import NamedTuple
+from typing import Final, NamedTuple
+
+from ._constants import IS_IMMUTABLE, IS_VALID, NOT_IMMUTABLE, NOT_VALID
 
 
 class CheckResult(NamedTuple):
@@ -10,4 +12,13 @@ class CheckResult(NamedTuple):
     """Indicates if the object is immutable according to validation rules."""
 
 
-__all__ = ('CheckResult',)
+VALID_IMMUTABLE: Final[CheckResult] = CheckResult(IS_VALID, IS_IMMUTABLE)
+"""Shared result for a valid, immutable object."""
+VALID_MUTABLE: Final[CheckResult] = CheckResult(IS_VALID, NOT_IMMUTABLE)
+"""Shared result for a valid, mutable object."""
+INVALID_IMMUTABLE: Final[CheckResult] = CheckResult(NOT_VALID, IS_IMMUTABLE)
+"""Shared result for an invalid, immutable object."""
+INVALID_MUTABLE: Final[CheckResult] = CheckResult(NOT_VALID, NOT_IMMUTABLE)
+"""Shared result for an invalid, mutable object."""
+
+__all__ = ('CheckResult', 'VALID_IMMUTABLE', 'VALID_MUTABLE', 'INVALID_IMMUTABLE', 'INVALID_MUTABLE')
@@ -10,7 +10,8 @@ from .._error_tags import TypeHintsErrorTag
 from .._exceptions import TypeCheckError
 from .._log import log
 from .._options import Options
-from .._validation_state import ValidationState
+from .._primitives import _all_instances_of_primitive_typehint
+from .._validation_state import ValidationChain, ValidationState, _push_state
 
 __all__ = (
     "_check_collections_abc_collection",
@@ -23,7 +24,7 @@ def _check_collections_abc_collection(
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """Handle Collection types.
 
@@ -32,7 +33,7 @@ def _check_collections_abc_collection(
     :param Any origin: The origin type of the type hint.
     :param tuple args: The type arguments of the Collection type hint.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     :raises TypeCheckError: If raise_on_error is True and validation fails.
@@ -48,7 +49,7 @@ def _check_collections_abc_collection(
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
 
     # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -72,20 +73,21 @@ def _check_collections_abc_collection(
         return CheckResult(NOT_VALID, NOT_IMMUTABLE)
 
     container_is_immutable: bool = isinstance(obj, Immutable)
-    new_parents = parents | {ValidationState(id(obj), type_hint, "collection")}
+    new_parents = _push_state(parents, ValidationState(id(obj), type_hint, "collection"))
     item_type_hint: Any = args[0] if args else Any
-    for item in obj:
-        is_valid, is_imm = _check_instance_of_typehint(
-            item, item_type_hint, options, new_parents, raise_on_error=False, context="collection_item")
-        if not is_valid:
-            if raise_on_error:
-                raise TypeCheckError(
-                    f"Item '{item}' in Collection does not match type hint '{item_type_hint}'.",
-                    tag=TypeHintsErrorTag.VALIDATION_FAILED)
-            return CheckResult(NOT_VALID, NOT_IMMUTABLE)
-        container_is_immutable = container_is_immutable and is_imm
+    if not _all_instances_of_primitive_typehint(obj, item_type_hint, options, new_parents):
+        for item in obj:
+            is_valid, is_imm = _check_instance_of_typehint(
+                item, item_type_hint, options, new_parents, raise_on_error=False, context="collection_item")
+            if not is_valid:
+                if raise_on_error:
+                    raise TypeCheckError(
+                        f"Item '{item}' in Collection does not match type hint '{item_type_hint}'.",
+                        tag=TypeHintsErrorTag.VALIDATION_FAILED)
+                return CheckResult(NOT_VALID, NOT_IMMUTABLE)
+            container_is_immutable = container_is_immutable and is_imm
 
     # If we reach here, all checks passed
     if container_is_immutable:
-        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types)
+        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types, variant=options.cache_variant)
     return CheckResult(IS_VALID, container_is_immutable)
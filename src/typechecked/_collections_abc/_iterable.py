@@ -10,7 +10,7 @@ from .._error_tags import TypeHintsErrorTag
 from .._exceptions import TypeCheckError
 from .._log import log
 from .._options import Options
-from .._validation_state import ValidationState
+from .._validation_state import ValidationChain, ValidationState, _push_state
 
 __all__ = (
     "_check_collections_abc_iterable",
@@ -23,7 +23,7 @@ def _check_collections_abc_iterable(
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """Handle Iterable types.
 
@@ -32,7 +32,7 @@ def _check_collections_abc_iterable(
     :param Any origin: The origin type of the type hint.
     :param tuple args: The type arguments of the Iterable type hint.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     :raises TypeCheckError: If raise_on_error is True and validation fails.
@@ -48,7 +48,7 @@ def _check_collections_abc_iterable(
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
 
     # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -76,7 +76,7 @@ def _check_collections_abc_iterable(
         return CheckResult(NOT_VALID, NOT_IMMUTABLE)
 
     container_is_immutable: bool = isinstance(obj, Immutable)
-    new_parents = parents | {ValidationState(id(obj), type_hint, "iterable")}
+    new_parents = _push_state(parents, ValidationState(id(obj), type_hint, "iterable"))
 
     # Handle Iterable[T]
     if len(args) == 1:
@@ -96,5 +96,5 @@ def _check_collections_abc_iterable(
 
     # If we reach here, all checks passed
     if container_is_immutable:
-        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types)
+        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types, variant=options.cache_variant)
     return CheckResult(IS_VALID, container_is_immutable)
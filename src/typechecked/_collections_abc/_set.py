@@ -10,7 +10,8 @@ from .._error_tags import TypeHintsErrorTag
 from .._exceptions import TypeCheckError
 from .._log import log
 from .._options import Options
-from .._validation_state import ValidationState
+from .._primitives import _all_instances_of_primitive_typehint
+from .._validation_state import ValidationChain, ValidationState, _push_state
 
 __all__ = (
     "_check_collections_abc_set",
@@ -23,7 +24,7 @@ def _check_collections_abc_set(
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """Handle Set types.
 
@@ -32,7 +33,7 @@ def _check_collections_abc_set(
     :param Any origin: The origin type of the type hint.
     :param tuple args: The type arguments of the Set type hint.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     :raises TypeCheckError: If raise_on_error is True and validation fails.
@@ -48,7 +49,7 @@ def _check_collections_abc_set(
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
 
     # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -79,20 +80,21 @@ def _check_collections_abc_set(
             f"Set type hint '{origin}' has invalid number of arguments: {len(args)}",
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
 
-    new_parents = parents | {ValidationState(id(obj), type_hint, "set")}
+    new_parents = _push_state(parents, ValidationState(id(obj), type_hint, "set"))
     container_is_immutable: bool = isinstance(obj, Immutable)
-    for item in obj:
-        is_valid, is_imm = _check_instance_of_typehint(
-            item, item_type, options, new_parents, raise_on_error, context="set_item")
-        if not is_valid:
-            if raise_on_error:
-                raise TypeCheckError(
-                    f"Item '{item}' in Set does not match type hint '{args[0] if args else Any}'.",
-                    tag=TypeHintsErrorTag.VALIDATION_FAILED)
-            return CheckResult(NOT_VALID, NOT_IMMUTABLE)
-        container_is_immutable = container_is_immutable and is_imm
+    if not _all_instances_of_primitive_typehint(obj, item_type, options, new_parents):
+        for item in obj:
+            is_valid, is_imm = _check_instance_of_typehint(
+                item, item_type, options, new_parents, raise_on_error, context="set_item")
+            if not is_valid:
+                if raise_on_error:
+                    raise TypeCheckError(
+                        f"Item '{item}' in Set does not match type hint '{args[0] if args else Any}'.",
+                        tag=TypeHintsErrorTag.VALIDATION_FAILED)
+                return CheckResult(NOT_VALID, NOT_IMMUTABLE)
+            container_is_immutable = container_is_immutable and is_imm
 
     # If we reach here, all checks passed
     if container_is_immutable:
-        _CACHE.add_cache_entry(type_hint, obj, IS_IMMUTABLE, options.noncachable_types)
+        _CACHE.add_cache_entry(type_hint, obj, IS_IMMUTABLE, options.noncachable_types, variant=options.cache_variant)
     return CheckResult(IS_VALID, container_is_immutable)
@@ -1,22 +1,78 @@
 """Helper functions to validate user-defined generic types against type hints."""
-from collections.abc import Callable, Collection, Iterable, Mapping, Sequence, Set
+# PERF NOTE: Do not use Numba (@njit / @jit) in this module.
+#
+# _check_generic is not a Numba candidate and object mode gives almost no speedup:
+#   - obj, type_hint and origin are arbitrary Python objects, not numeric arrays.
+#   - Error messages are built with f-strings from type names and type hints.
+#   - isinstance() is wrapped in try/except TypeError for origins that are not types.
+#   - Type hints are probed with hasattr()/getattr() (__mro__, _is_runtime_protocol).
+#   - Validation recurses through _check_instance_of_typehint and the collections.abc
+#     checkers, which have different signatures.
+#   - The return type is a CheckResult or a raised TypeCheckError.
+#
+# Numba imports are flagged by pylint (see deprecated-modules in pyproject.toml).
+# Speedups for this module belong in Python level changes, such as the dispatch caches below.
+import logging
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Sequence,
+    Set,
+)
+from functools import lru_cache
 from typing import Any, Protocol
 
 from ._cache import _CACHE
-from ._check_result import CheckResult
-from ._constants import IS_IMMUTABLE, IS_VALID, NOT_VALID
+from ._check_result import INVALID_IMMUTABLE, INVALID_MUTABLE, VALID_IMMUTABLE, VALID_MUTABLE, CheckResult
+from ._collections_abc import (
+    _check_collections_abc_callable,
+    _check_collections_abc_collection,
+    _check_collections_abc_iterable,
+    _check_collections_abc_mapping,
+    _check_collections_abc_sequence,
+    _check_collections_abc_set,
+)
+from ._constants import IS_VALID
 from ._error_tags import TypeHintsErrorTag
 from ._exceptions import TypeCheckError
 from ._immutable import is_immutable
 from ._log import log
 from ._options import Options
 from ._types import Never, NotRequired, ReadOnly, Required
-from ._validation_state import ValidationState
+from ._validation_state import ValidationChain, ValidationState, _push_state
 
 __all__ = (
     "_check_generic",
+    "_clear_type_hint_caches",
+    "_reset_dispatch_cache",
 )
 
+_COMMON_ORIGIN_CHECKERS: dict[Any, Callable[..., CheckResult] | None] = {}
+"""The collections.abc checker selected for each of the common origins in ``_ABC_ORIGINS``.
+
+Filled in by :func:`_reset_dispatch_cache`. Other origins are cached by the bounded
+:func:`_pick_abc_checker` cache, so classes created at runtime are not kept alive indefinitely.
+"""
+
+_INVALID_ORIGINS: frozenset[Any] = frozenset((Required, NotRequired, ReadOnly, Never))
+"""Origins that are only valid inside a TypedDict context."""
+
+_ABC_ORIGINS: tuple[Any, ...] = (
+    dict, list, tuple, set, frozenset,
+    Mapping, MutableMapping, Set, MutableSet, Sequence, MutableSequence,
+    Collection, Iterable, Iterator, Callable,
+)
+"""Common generic origins whose checkers are resolved when the dispatch caches are reset."""
+
+_NOT_COMMON: Any = object()
+"""Sentinel for an origin that is not in ``_COMMON_ORIGIN_CHECKERS``."""
+
 
 def _check_generic(  # pylint: disable=too-many-locals,too-many-return-statements  # noqa: C901
         obj: Any,
@@ -24,7 +80,7 @@ def _check_generic(  # pylint: disable=too-many-locals,too-many-return-statement
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False,
         context: str = "") -> CheckResult:
     """
@@ -35,160 +91,240 @@ def _check_generic(  # pylint: disable=too-many-locals,too-many-return-statement
     :param Any origin: The origin of the generic type.
     :param tuple args: The type arguments for the generic.
     :param options: Validation options.
-    :param set parents: Parent validation states for cycle detection.
+    :param ValidationChain | None parents: Chain of parent validation states for cycle detection.
     :param bool raise_on_error: Whether to raise on validation failure.
     :param str context: Context of the validation for error reporting.
     :return: CheckResult indicating (is_valid, is_immutable).
     """
-    from ._collections_abc import (  # pylint: disable=import-outside-toplevel
-        _check_collections_abc_callable,
-        _check_collections_abc_collection,
-        _check_collections_abc_iterable,
-        _check_collections_abc_mapping,
-        _check_collections_abc_sequence,
-        _check_collections_abc_set,
-    )
+    obj_type: type = type(obj)
+    # An empty set is passed on as None so add_cache_entry() skips the membership test
+    noncachable_types: set[type[Any]] | None = options.noncachable_types or None
 
     # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
-        log.debug(
-            "_check_instance_of_typehint: Cache hit for object of type '%s' and type hint '%s'",
-            type(obj).__name__, type_hint)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "_check_instance_of_typehint: Cache hit for object of type '%s' and type hint '%s'",
+                obj_type.__name__, type_hint)
         if cached_result or not raise_on_error:
-            return CheckResult(cached_result, IS_IMMUTABLE)
+            return VALID_IMMUTABLE if cached_result else INVALID_IMMUTABLE
         raise TypeCheckError(
-            f"Object of type '{type(obj).__name__}' is not an instance of type hint '{type_hint}'",
+            f"Object of type '{obj_type.__name__}' is not an instance of type hint '{type_hint}'",
             tag=TypeHintsErrorTag.TYPE_HINT_MISMATCH)
 
-    obj_is_immutable: bool = is_immutable(obj)
-
     # handler for non-runtime Protocols
-    if (hasattr(type_hint, '__mro__')
-            and any(base is Protocol for base in type_hint.__mro__)
-            and not getattr(type_hint, '_is_runtime_protocol', False)):
+    try:
+        non_runtime_protocol = _is_non_runtime_protocol(type_hint)
+    except TypeError:  # unhashable type hint, cannot be cached
+        non_runtime_protocol = _is_non_runtime_protocol.__wrapped__(type_hint)
+    if non_runtime_protocol:
         if raise_on_error:
             raise TypeCheckError(
                 f'Protocol {type_hint} is not runtime checkable.',
                 tag=TypeHintsErrorTag.NON_RUNTIME_CHECKABLE_PROTOCOL)
-        return CheckResult(NOT_VALID, obj_is_immutable)
+        return INVALID_IMMUTABLE if is_immutable(obj) else INVALID_MUTABLE
 
     if origin is None and isinstance(type_hint, type):
-        if issubclass(type_hint, Mapping):
-            origin = type_hint
-            args = (Any, Any)
-        elif issubclass(type_hint, Iterable):
-            origin = type_hint
-            args = (Any,)
-        elif issubclass(type_hint, Callable):  # type: ignore[arg-type]
-            origin = type_hint
-            args = (..., Any)
+        try:
+            normalized = _normalize_bare_class_hint(type_hint)
+        except TypeError:  # unhashable type hint, cannot be cached
+            normalized = _normalize_bare_class_hint.__wrapped__(type_hint)
+        if normalized is not None:
+            origin, args = normalized
+
+    result: CheckResult | None = None
 
     # Check instance type for generics
     if origin is None:
-        valid = isinstance(obj, type_hint)
-        if valid:
-            if obj_is_immutable:
-                _CACHE.add_cache_entry(type_hint, obj, IS_VALID, options.noncachable_types)
-            return CheckResult(IS_VALID, obj_is_immutable)
-        if raise_on_error:
-            raise TypeCheckError(
-                f'Object of type {type(obj).__name__} is not an instance of {type_hint} '
-                f'(origin = {origin}, args = {args})',
-                tag=TypeHintsErrorTag.VALIDATION_FAILED
-            )
-        return CheckResult(NOT_VALID, obj_is_immutable)
-
-    try:
-        if not isinstance(obj, origin):
+        if not isinstance(obj, type_hint):
             if raise_on_error:
                 raise TypeCheckError(
-                    f'Object of type {type(obj).__name__} is not an instance of {origin.__name__}',
+                    f'Object of type {obj_type.__name__} is not an instance of {type_hint} '
+                    f'(origin = {origin}, args = {args})',
                     tag=TypeHintsErrorTag.VALIDATION_FAILED
                 )
-            return CheckResult(NOT_VALID, obj_is_immutable)
-    except TypeError as exc:
-        if isinstance(exc, TypeCheckError):
-            raise
-        # Some origins may not be valid types for isinstance checks
-        if origin in {Required, NotRequired, ReadOnly, Never}:
+            return INVALID_IMMUTABLE if is_immutable(obj) else INVALID_MUTABLE
+        result = VALID_IMMUTABLE if is_immutable(obj) else VALID_MUTABLE
+
+    else:
+        try:
+            # Exact type match is the common case for concrete containers and skips the MRO walk
+            if obj_type is not origin and not isinstance(obj, origin):
+                if raise_on_error:
+                    raise TypeCheckError(
+                        f'Object of type {obj_type.__name__} is not an instance of {origin.__name__}',
+                        tag=TypeHintsErrorTag.VALIDATION_FAILED
+                    )
+                return INVALID_IMMUTABLE if is_immutable(obj) else INVALID_MUTABLE
+        except TypeError as exc:
+            if isinstance(exc, TypeCheckError):
+                raise
+            # Some origins may not be valid types for isinstance checks
+            if origin in _INVALID_ORIGINS:
+                raise TypeCheckError(
+                    f'Origin {origin} ({type_hint}) is not a valid type outside of a TypedDict context.',
+                    tag=TypeHintsErrorTag.VALIDATION_FAILED) from exc
             raise TypeCheckError(
-                f'Origin {origin} ({type_hint}) is not a valid type outside of a TypedDict context.',
+                f'Origin {origin} ({type_hint}) is not a valid type for isinstance check.',
                 tag=TypeHintsErrorTag.VALIDATION_FAILED) from exc
+
+        # If no args, treat as non-parameterized generic
+        try:
+            if not args and isinstance(obj, type_hint):
+                result = VALID_IMMUTABLE if is_immutable(obj) else VALID_MUTABLE
+        except TypeError:
+            pass
+
+        # Dispatch to the appropriate container check.
+        # The order (most specific to most general) is important.
+        # _pick_abc_checker ensures that only one container check is applied
+        # and that it is the most specific one available.
+        if result is None and origin:
+            new_parents = _push_state(parents, ValidationState(id(obj), type_hint, context))
+
+            checker = _abc_checker_for(origin)
+            if checker is _check_collections_abc_callable:
+                result = checker(obj, type_hint, origin, args, raise_on_error)
+            elif checker is not None:
+                result = checker(obj, type_hint, origin, args, options, new_parents, raise_on_error)
+
+    if result is None:
+        # If we reached here, something very, very wierd is going on.
+        # We will raise an error to flag this situation but this should
+        # never happen under normal circumstances.
+        # There used to be fallback code here, but we couldn't come up with an actual
+        # example that reached that code path even with user-defined generics that
+        # were manually constructed.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "_check_generic: No specific check found for object of type '%s' against generic type hint '%s'",
+                obj_type.__name__, type_hint)
+
+        raise TypeCheckError(
+            f"Unable to validate object of type '{obj_type.__name__}' against "
+            f"generic type hint '{type_hint}'",
+            tag=TypeHintsErrorTag.UNHANDLED_GENERIC_TYPE_HINT)
+
+    # Single exit for all checks that produced a result
+    if result.valid and result.immutable:
+        _CACHE.add_cache_entry(type_hint, obj, IS_VALID, noncachable_types, variant=options.cache_variant)
+    if raise_on_error and not result.valid:
         raise TypeCheckError(
-            f'Origin {origin} ({type_hint}) is not a valid type for isinstance check.',
-            tag=TypeHintsErrorTag.VALIDATION_FAILED) from exc
+            f"Object of type '{obj_type.__name__}' is not an instance of generic type hint '{type_hint}'",
+            tag=TypeHintsErrorTag.TYPE_HINT_MISMATCH)
+    return result
+
+
+@lru_cache(maxsize=512)
+def _is_non_runtime_protocol(type_hint: Any) -> bool:
+    """
+    Check if a type hint is a Protocol that is not runtime checkable.
+
+    The result is cached per type hint because walking the MRO is invariant for a given hint.
 
-    # If no args, treat as non-parameterized generic
+    :param Any type_hint: The type hint to check.
+    :return bool: True if the type hint is a non-runtime checkable Protocol, False otherwise.
+    """
+    return (hasattr(type_hint, '__mro__')
+            and any(base is Protocol for base in type_hint.__mro__)
+            and not getattr(type_hint, '_is_runtime_protocol', False))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_bare_class_hint(type_hint: type) -> tuple[Any, tuple] | None:
+    """
+    Get the origin and args to use for an unparameterized container class used as a type hint.
+
+    Bare Mapping, Iterable and Callable classes (e.g. ``dict``) are treated as if
+    parameterized with ``Any`` (e.g. ``dict[Any, Any]``). The result is cached per
+    type hint because it is invariant for a given class.
+
+    :param type type_hint: The class used as a type hint.
+    :return tuple[Any, tuple] | None: The (origin, args) to use, or None if the class
+        is not a Mapping, Iterable or Callable.
+    """
+    if issubclass(type_hint, Mapping):
+        return type_hint, (Any, Any)
+    if issubclass(type_hint, Iterable):
+        return type_hint, (Any,)
+    if issubclass(type_hint, Callable):  # type: ignore[arg-type]
+        return type_hint, (..., Any)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _pick_abc_checker(origin: Any) -> Callable[..., CheckResult] | None:  # pylint: disable=too-many-return-statements
+    """
+    Select the collections.abc checker for a generic origin.
+
+    The checker chosen for an origin never changes, so the result is cached per origin and
+    the chain of ``issubclass()`` checks against the collections.abc classes only runs once.
+
+    Order of checks is important: most specific to most general.
+    Each check is mutually exclusive due to the if..elif structure
+    and is designed to pick the most specific applicable check.
+
+    :param Any origin: The origin of the generic type.
+    :return Callable[..., CheckResult] | None: The checker to use, or None if the
+        origin is not a collections.abc type.
+    """
     try:
-        if not args and isinstance(obj, type_hint):
-            if obj_is_immutable:
-                _CACHE.add_cache_entry(type_hint, obj, IS_VALID, options.noncachable_types)
-            return CheckResult(IS_VALID, obj_is_immutable)
+        # Fast fail path for collections.abc
+        if not issubclass(origin, (Iterable, Callable)):  # type: ignore[arg-type]
+            return None
     except TypeError:
-        pass
+        return None
 
-    # Dispatch to the appropriate container check.
-    # The order (most specific to most general) is important.
-    # The if..elif chain ensures that only one container check is applied
-    # and that it is the most specific one available.
-    result: CheckResult | None = None
+    if issubclass(origin, Mapping):
+        return _check_collections_abc_mapping
+    if issubclass(origin, Set):
+        return _check_collections_abc_set
+    if issubclass(origin, Sequence):
+        return _check_collections_abc_sequence
+    if issubclass(origin, Collection):
+        return _check_collections_abc_collection
+    if issubclass(origin, Iterable):
+        return _check_collections_abc_iterable
+    if issubclass(origin, Callable):  # type: ignore[arg-type]
+        return _check_collections_abc_callable
+    return None
 
-    new_parents = parents.copy()
-    new_parents.add(ValidationState(id(obj), type_hint, context))
 
-    if origin:
-        # Fast fail path for collections.abc
-        is_collections_abc: bool
-        try:
-            is_collections_abc = issubclass(origin, (Iterable, Callable))  # type: ignore[arg-type]
-        except TypeError:
-            is_collections_abc = False
-
-        # primary check path for all collections.abc types
-        # Order of checks is important: most specific to most general
-        # Each check is mutually exclusive due to the if..elif structure
-        # and is designed to pick the most specific applicable check.
-        if is_collections_abc:
-            if issubclass(origin, Mapping):
-                result = _check_collections_abc_mapping(
-                    obj, type_hint, origin, args, options, new_parents, raise_on_error)
-            elif issubclass(origin, Set):
-                result = _check_collections_abc_set(
-                    obj, type_hint, origin, args, options, new_parents, raise_on_error)
-            elif issubclass(origin, Sequence):
-                result = _check_collections_abc_sequence(
-                    obj, type_hint, origin, args, options, new_parents, raise_on_error)
-            elif issubclass(origin, Collection):
-                result = _check_collections_abc_collection(
-                    obj, type_hint, origin, args, options, new_parents, raise_on_error)
-            elif issubclass(origin, Iterable):
-                result = _check_collections_abc_iterable(
-                    obj, type_hint, origin, args, options, new_parents, raise_on_error)
-            elif issubclass(origin, Callable):  # type: ignore[arg-type]
-                result = _check_collections_abc_callable(
-                    obj, type_hint, origin, args, raise_on_error)
-
-    if result is not None:
-        if result.valid and result.immutable:
-            _CACHE.add_cache_entry(type_hint, obj, result.immutable, options.noncachable_types)
-        if raise_on_error and not result.valid:
-            raise TypeCheckError(
-                f"Object of type '{type(obj).__name__}' is not an instance of generic type hint '{type_hint}'",
-                tag=TypeHintsErrorTag.TYPE_HINT_MISMATCH)
-        return result
-
-    # If we reached here, something very, very wierd is going on.
-    # We will raise an error to flag this situation but this should
-    # never happen under normal circumstances.
-    # There used to be fallback code here, but we couldn't come up with an actual
-    # example that reached that code path even with user-defined generics that
-    # were manually constructed.
-    log.debug(
-        "_check_generic: No specific check found for object of type '%s' against generic type hint '%s'",
-        type(obj).__name__, type_hint)
-
-    raise TypeCheckError(
-        f"Unable to validate object of type '{type(obj).__name__}' against "
-        f"generic type hint '{type_hint}'",
-        tag=TypeHintsErrorTag.UNHANDLED_GENERIC_TYPE_HINT)
+def _abc_checker_for(origin: Any) -> Callable[..., CheckResult] | None:
+    """
+    Get the collections.abc checker for a generic origin, using the dispatch caches.
+
+    :param Any origin: The origin of the generic type.
+    :return Callable[..., CheckResult] | None: The checker to use, or None if the
+        origin is not a collections.abc type.
+    """
+    try:
+        checker = _COMMON_ORIGIN_CHECKERS.get(origin, _NOT_COMMON)
+        if checker is _NOT_COMMON:
+            checker = _pick_abc_checker(origin)
+        return checker
+    except TypeError:  # unhashable origin, cannot be cached
+        return _pick_abc_checker.__wrapped__(origin)
+
+
+def _reset_dispatch_cache() -> None:
+    """Reset the caches of collections.abc checkers selected per origin.
+
+    The caches are cleared and the checkers for ``_ABC_ORIGINS`` are selected again.
+    Needed if classes are registered with a collections.abc class after
+    an origin has already been dispatched.
+    """
+    _pick_abc_checker.cache_clear()
+    _COMMON_ORIGIN_CHECKERS.clear()
+    for origin in _ABC_ORIGINS:
+        _COMMON_ORIGIN_CHECKERS[origin] = _pick_abc_checker.__wrapped__(origin)
+
+
+def _clear_type_hint_caches() -> None:
+    """Clear the per type hint caches used by :func:`_check_generic`."""
+    _is_non_runtime_protocol.cache_clear()
+    _normalize_bare_class_hint.cache_clear()
+
+
+_reset_dispatch_cache()
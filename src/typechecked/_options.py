@@ -21,3 +21,19 @@ class Options(NamedTuple):
     """Whether to consume iterators during validation."""
     noncachable_types: set[type[Any]] | None = None
     """Set of types that should not be cached during validation."""
+
+    @property
+    def cache_variant(self) -> bool:
+        """The options that affect the validity of a cacheable result.
+
+        Validation results are cached per variant, so that a result is only reused by checks
+        made with the same values for these options.
+
+        ``depth`` is not part of the variant. Results truncated by the depth limit are never
+        immutable, so they are never cached, and checks past the depth limit return before the
+        cache is consulted. Cached invalid results come from failed ``isinstance()`` checks,
+        which do not depend on depth.
+
+        :return bool: The variant key for the validation cache.
+        """
+        return self.strict_typed_dict
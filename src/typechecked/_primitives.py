@@ -1,14 +1,21 @@
 """Helper function to validate primitive types against type hints."""
+from collections.abc import Iterable
 from enum import Enum
+from itertools import repeat
 from types import NoneType
 from typing import Any, TypeAlias
 
+from ._options import Options
+from ._validation_state import ValidationChain
+
 __all__ = (
     "ImmutablePrimitiveTypes",
     "ImmutablePrimitiveTypesTuple",
     "IMMUTABLE_PRIMITIVE_TYPES_SET",
+    "PRIMITIVE_TYPEHINTS",
     "_is_primitive_typehint",
     "_is_primitive",
+    "_all_instances_of_primitive_typehint",
 )
 
 ImmutablePrimitiveTypes: TypeAlias = int | str | bytes | bool | float | complex | type[None] | range | Enum
@@ -26,6 +33,9 @@ IMMUTABLE_PRIMITIVE_TYPES_SET: set[Any] = set(ImmutablePrimitiveTypesTuple)
 `None` is included as a special case.
 """
 
+PRIMITIVE_TYPEHINTS: frozenset[type] = frozenset((int, float, complex, bool, bytes, str))
+"""Type hints that are checked with a plain isinstance() and always give immutable results."""
+
 
 def _is_primitive_typehint(type_hint: Any) -> bool:
     """
@@ -58,3 +68,27 @@ def _is_primitive(obj: Any) -> bool:
         return isinstance(obj, ImmutablePrimitiveTypesTuple)
     except (TypeError, ValueError, AttributeError):
         return False
+
+
+def _all_instances_of_primitive_typehint(
+        items: Iterable[Any], type_hint: Any, options: Options, parents: ValidationChain) -> bool:
+    """
+    Fast path check that all items are instances of a primitive type hint.
+
+    This gives the same answer as checking each item individually against one of
+    the :data:`PRIMITIVE_TYPEHINTS` (int, float, complex, bool, bytes, str),
+    but runs the isinstance() calls in a single C level loop.
+
+    Returns `False` if the type hint is not one of the primitive type hints, or if the
+    items are past the depth limit (where they are accepted without being checked),
+    so callers fall back to checking each item individually.
+
+    :param Iterable[Any] items: The items to check. Must be re-iterable.
+    :param Any type_hint: The type hint for the items.
+    :param Options options: Options for type hint validation.
+    :param ValidationChain parents: Chain of parent validation states, including the container of the items.
+    :return bool: True if the type hint is primitive and all items are instances of it.
+    """
+    if type_hint not in PRIMITIVE_TYPEHINTS or options.depth < parents.depth:
+        return False
+    return all(map(isinstance, items, repeat(type_hint)))
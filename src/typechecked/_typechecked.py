@@ -9,12 +9,13 @@ from ._check_result import CheckResult
 from ._constants import IS_IMMUTABLE, IS_VALID, NOT_IMMUTABLE, NOT_VALID
 from ._error_tags import TypeHintsErrorTag
 from ._exceptions import TypeCheckError
-from ._generic import _check_generic
+from ._generic import _check_generic, _clear_type_hint_caches, _reset_dispatch_cache
 from ._immutable import is_immutable
 from ._log import log
 from ._options import Options
+from ._primitives import PRIMITIVE_TYPEHINTS
 from ._typing import _check_typing_literal, _check_typing_typeddict, _check_typing_union
-from ._validation_state import ValidationState
+from ._validation_state import ValidationChain, ValidationState, _in_chain, _push_new_state
 
 __all__ = (
     "isinstance_of_typehint",
@@ -27,6 +28,8 @@ T = TypeVar("T", bound=TypedDict)  # type: ignore[invalidTypeForm, valid-type]
 def clear_typechecked_cache() -> None:
     """Clear the internal type hint validation cache."""
     _CACHE.clear()
+    _reset_dispatch_cache()
+    _clear_type_hint_caches()
 
 
 def isinstance_of_typehint(
@@ -214,7 +217,7 @@ def isinstance_of_typehint(
         consume_iterators=consume_iterators,
         noncachable_types=noncachable_types or {NoneType, bool, int, float, complex, str, bytes})
     result = _check_instance_of_typehint(
-        obj, type_hint, options, parents=set(), raise_on_error=False, context="root")
+        obj, type_hint, options, parents=None, raise_on_error=False, context="root")
     return result.valid
 
 
@@ -222,7 +225,7 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
         obj: Any,
         type_hint: Any,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False,
         *,
         context: str) -> CheckResult:
@@ -232,7 +235,7 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
     :param Any obj: The object to check.
     :param Any type_hint: The type hint to check against.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :param str context: The context of the validation check.
     :return CheckResult: Named tuple indicating (is_valid (obj.valid), is_immutable (obj.immutable)).
@@ -240,8 +243,14 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
     log.debug("_check_instance_of_typehint: Checking object of type '%s' against type hint '%s' in context '%s'",
               type(obj).__name__, type_hint, context)
 
-    # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    # If we have hit the depth limit for the check,
+    # Return Valid, but not Immutable (as we can't be sure).
+    # This comes before the cache so a result cached by a full check is not used past the limit.
+    if parents is not None and options.depth < parents.depth:
+        return CheckResult(IS_VALID, NOT_IMMUTABLE)
+
+    # Check the cache
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -249,23 +258,18 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
             f"Object of type '{type(obj).__name__}' is not an instance of type hint '{type_hint}'",
             tag=TypeHintsErrorTag.TYPE_HINT_MISMATCH)
 
-    # If we have hit the depth limit for the check,
-    # Return Valid, but not Immutable (as we can't be sure)
-    if options.depth < len(parents):
-        return CheckResult(IS_VALID, NOT_IMMUTABLE)
-
     origin = get_origin(type_hint)
     args = get_args(type_hint)
 
     current_state = ValidationState(id(obj), type_hint, context)
-    if current_state in parents:
+    if _in_chain(parents, current_state):
         if raise_on_error:
             raise TypeCheckError(
                 f"Cycle detected in object graph for object of type '{type(obj).__name__}'.",
                 tag=TypeHintsErrorTag.CYCLIC_REFERENCE_DETECTED)
         return CheckResult(NOT_VALID, NOT_IMMUTABLE)
 
-    new_parents = parents | {current_state}
+    new_parents = _push_new_state(parents, current_state)  # not in the chain, as checked above
 
     # Unwrap Final, ClassVar and Annotated type hints
     if origin is not None and origin.__module__ == 'typing':
@@ -326,7 +330,7 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
         if isinstance(obj, (float, int, bool, complex, bytes, str)):
             return CheckResult(IS_VALID, IS_IMMUTABLE)
 
-    if type_hint in {int, float, complex, bool, bytes, str}:
+    if type_hint in PRIMITIVE_TYPEHINTS:
         if isinstance(obj, type_hint):
             return CheckResult(IS_VALID, IS_IMMUTABLE)
         if raise_on_error:
@@ -348,7 +352,7 @@ def _check_instance_of_typehint(  # pylint: disable=too-many-return-statements
             obj, type_hint, origin, args, options, new_parents, raise_on_error, context='root')
 
     if result.immutable:
-        _CACHE.add_cache_entry(type_hint, obj, result.valid, options.noncachable_types)
+        _CACHE.add_cache_entry(type_hint, obj, result.valid, options.noncachable_types, variant=options.cache_variant)
 
     if raise_on_error and not result.valid:
         raise TypeCheckError(
@@ -364,7 +368,7 @@ def _check_none_instance_of_typehint(
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """
     Internal function to check if None is an instance of a given type hint.
@@ -374,7 +378,7 @@ def _check_none_instance_of_typehint(
     :param Any origin: The origin type of the type hint.
     :param tuple args: The type arguments of the type hint.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     """
@@ -383,7 +387,7 @@ def _check_none_instance_of_typehint(
             f"Object is not None, got '{obj}'.",
             tag=TypeHintsErrorTag.INVALID_NONE_CHECK)
 
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -405,7 +409,7 @@ def _check_none_instance_of_typehint(
                 return CheckResult(IS_VALID, IS_IMMUTABLE)
 
     check_result = CheckResult(NOT_VALID, IS_IMMUTABLE)
-    _CACHE.add_cache_entry(type_hint, obj, check_result.immutable, options.noncachable_types)
+    _CACHE.add_cache_entry(type_hint, obj, check_result.valid, options.noncachable_types, variant=options.cache_variant)
 
     if raise_on_error:
         raise TypeCheckError(
@@ -11,7 +11,7 @@ from .._exceptions import TypeCheckError
 from .._immutable import Immutable, is_immutable_typeddict_typehint
 from .._log import log
 from .._options import Options
-from .._validation_state import ValidationState
+from .._validation_state import ValidationChain, ValidationState, _push_state
 from ._typeddict_key_info import TypedDictKeyInfo
 
 if sys.version_info >= (3, 11):
@@ -33,14 +33,14 @@ def _check_typing_typeddict(  # pylint: disable=too-many-locals,too-many-return-
         obj: Any,
         type_hint: Any,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """Handle TypedDict types.
 
     :param Any obj: The object to check.
     :param Any type_hint: The type hint to check against.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     :raises TypeCheckError: If raise_on_error is True and validation fails.
@@ -57,7 +57,7 @@ def _check_typing_typeddict(  # pylint: disable=too-many-locals,too-many-return-
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
 
     # Check the cache first
-    cached_result = _CACHE.valid_in_cache(type_hint, obj)
+    cached_result = _CACHE.valid_in_cache(type_hint, obj, variant=options.cache_variant)
     if cached_result is not None:  # Only cached if Immutable
         if cached_result or not raise_on_error:
             return CheckResult(cached_result, IS_IMMUTABLE)
@@ -118,7 +118,7 @@ def _check_typing_typeddict(  # pylint: disable=too-many-locals,too-many-return-
         optional_keys.discard('__immutable__')
         allowed_keys.discard('__immutable__')
 
-    new_parents = parents | {ValidationState(id(obj), type_hint, "typeddict")}
+    new_parents = _push_state(parents, ValidationState(id(obj), type_hint, "typeddict"))
 
     # check for 'extra_items' if typeddict class explicitly sets it
     # If not set, default is Never (no extra items allowed)
@@ -229,5 +229,5 @@ def _check_typing_typeddict(  # pylint: disable=too-many-locals,too-many-return-
 
     # Successful TypedDict check
     if container_is_immutable:
-        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types)
+        _CACHE.add_cache_entry(type_hint, obj, True, options.noncachable_types, variant=options.cache_variant)
     return CheckResult(IS_VALID, container_is_immutable)
@@ -10,7 +10,7 @@ from .._exceptions import TypeCheckError
 from .._immutable import is_immutable
 from .._log import log
 from .._options import Options
-from .._validation_state import ValidationState
+from .._validation_state import ValidationChain, ValidationState, _push_state
 
 __all__ = (
     "_check_typing_union",
@@ -23,7 +23,7 @@ def _check_typing_union(
         origin: Any,
         args: tuple,
         options: Options,
-        parents: set[ValidationState],
+        parents: ValidationChain | None,
         raise_on_error: bool = False) -> CheckResult:
     """Handle Union types first as an exclusive check.
 
@@ -31,7 +31,7 @@ def _check_typing_union(
     :param Any type_hint: The type hint to check against.
     :param tuple args: The type arguments of the Union type hint.
     :param Options options: Options for type hint validation.
-    :param set[ValidationState] parents: Set of parent object IDs to detect cycles.
+    :param ValidationChain | None parents: Chain of parent validation states to detect cycles.
     :param bool raise_on_error: Whether to raise an exception on validation failure.
     :return CheckResult: Tuple indicating (is_valid, is_immutable).
     :raises TypeCheckError: If raise_on_error is True and validation fails
@@ -44,8 +44,7 @@ def _check_typing_union(
         raise TypeCheckError(
             f"Type hint '{type_hint}' is not a Union type.",
             tag=TypeHintsErrorTag.INVALID_TYPE_HINT)
-    new_parents = parents.copy()
-    new_parents.add(ValidationState(id(obj), type_hint, "union"))
+    new_parents = _push_state(parents, ValidationState(id(obj), type_hint, "union"))
     for arg in args:
         # Recursively check against each type in the Union
         is_valid, is_imm = _check_instance_of_typehint(
@@ -55,7 +54,7 @@ def _check_typing_union(
         if is_valid:
             # We can cache the result for the specific matching type `arg`
             if is_imm:
-                _CACHE.add_cache_entry(arg, obj, True, options.noncachable_types)
+                _CACHE.add_cache_entry(arg, obj, True, options.noncachable_types, variant=options.cache_variant)
             return CheckResult(is_valid, is_imm)
 
     if raise_on_error:
@@ -1,17 +1,20 @@
 """Cache for validation results."""
 import logging
 import threading
-from collections import OrderedDict
+import weakref
 from collections.abc import Hashable
+from types import NoneType
 from typing import Any
 
 from .._exceptions import TypeCheckError
-from ._cache_entry import CacheEntry, ObjectWrapper
-from ._cache_key import CacheKey
+from ._cache_entry import CacheEntry
 from ._error_tags import ValidationCacheErrorTag
 
 log = logging.getLogger(__name__)
 
+_NO_HINT: Any = object()
+"""Sentinel type hint for an empty last type hint slot. Never equal to a real type hint."""
+
 
 class ValidationCache:
     """Cache for validated references.
@@ -22,6 +25,16 @@ class ValidationCache:
 
     It allows quick checks for previously seen validation checks to avoid redundant
     validation of the same structure multiple times during report processing.
+
+    Entries are grouped into one bucket per type hint and variant, keyed by the id() of
+    the object. The variant identifies the validation options that affect validity, so
+    results are only reused for checks made with the same options.
+    The bucket for the most recently looked up type hint is remembered so that checking
+    many objects against the same type hint object (e.g. the items of a container)
+    skips the type hint lookup.
+
+    Cached objects are only weakly referenced, so the cache never keeps them alive.
+    Objects that cannot be weakly referenced are not cached, except for ``None``.
     """
     def __init__(self, min_cache_size: int = 100, max_cache_size: int = 16384) -> None:
         """Initialize the ValidationCache.
@@ -42,8 +55,8 @@ class ValidationCache:
         self._cache_lock: threading.RLock = threading.RLock()
         """Lock for thread-safe access to the cache."""
 
-        self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
-        """Cache for validated references.
+        self._cache: dict[tuple[Hashable, Hashable], dict[int, CacheEntry]] = {}
+        """Cache for validated references, as ``{(type hint, variant): {id(obj): CacheEntry}}``.
 
         This structure allows efficient caching and retrieval of references while
         with their validity state while minimizing memory usage and lookup time.
@@ -51,10 +64,21 @@ class ValidationCache:
 
         It allows quick checks for previously seen validation checks to avoid redundant validation
         of the same structure multiple times during report processing. If a subtree matches a cached
-        object id and class it can be reused directly from the cache without re-validation of the subtree.
+        object id and type hint it can be reused directly from the cache without re-validation of the subtree.
+
+        Both levels are kept in insertion order, which is used to trim the oldest entries first.
+        """
+        self._size: int = 0
+        """Total number of entries in all buckets of the cache."""
+
+        self._last: tuple[Any, Hashable, dict[int, CacheEntry]] = (_NO_HINT, None, {})
+        """The most recently looked up type hint, variant and their bucket.
+
+        Stored as a single tuple so that lock-free readers always see a matching set.
+        Reset whenever a bucket is removed from the cache.
         """
 
-    def valid_in_cache(self, td_cls: Hashable, obj: object) -> bool | None:
+    def valid_in_cache(self, td_cls: Hashable, obj: object, variant: Hashable = None) -> bool | None:
         """
         Check if a reference validity is cached and return its validity if found.
 
@@ -63,32 +87,27 @@ class ValidationCache:
         This is a strict identity check that the obj in the cache is the same object,
         not just 'equal' to it.
 
-        The cache key is based on the type of the value and its id().
+        The cache key is based on the type hint, the variant and the id() of the object.
 
-        Access is optimized for performance with optimistic lock-free read access and
-        thread-safe locking if a cache modification is needed.
+        Access is optimized for performance with optimistic lock-free read access.
 
         :param Hashable td_cls: The type hint of the value reference to check.
         :param object obj: The object reference to check.
+        :param Hashable variant: The validation options that affect validity (see :attr:`Options.cache_variant`).
         :return bool | None: The cached validity if found, or None if not found in cache.
         """
-        log.debug("valid_in_cache: Checking cache for object of type '%s' with id %d",
-                  td_cls, id(obj))
-        key: CacheKey = CacheKey(td_cls, obj)
-        if key in self._cache:
-            try:  # optimistic access for performance
-                entry: CacheEntry = self._cache[key]
-                wrapped_value: ObjectWrapper | None = entry.obj_wrapper
-                if wrapped_value is None:
-                    # Stale reference, remove from cache.
-                    with self._cache_lock:
-                        del self._cache[key]
-                    return None
-                if wrapped_value.obj is obj:  # strict identity check, which is why we keep the object in the wrapper
-                    return entry.is_valid
-            except KeyError:
-                # Item was removed between the 'in' check and access by another thread
+        if td_cls is None:  # None is a special case, replace with NoneType instead
+            td_cls = NoneType  # type: ignore[assignment]
+        last_hint, last_variant, bucket = self._last
+        if td_cls is not last_hint or variant != last_variant:
+            found: dict[int, CacheEntry] | None = self._cache.get((td_cls, variant))
+            if found is None:
                 return None
+            bucket = found
+            self._last = (td_cls, variant, bucket)
+        entry: CacheEntry | None = bucket.get(id(obj))
+        if entry is not None and entry.ref() is obj:  # strict identity check
+            return entry.is_valid
         return None
 
     def add_cache_entry(
@@ -96,12 +115,17 @@ class ValidationCache:
             td_cls: Hashable,
             obj: object,
             is_valid: bool,
-            noncachable_types: set[type[Any]] | None = None) -> None:
+            noncachable_types: set[type[Any]] | None = None,
+            variant: Hashable = None) -> None:
         """Cache a CacheEntry
 
+        Objects that cannot be weakly referenced, other than ``None``, are not cached.
+
         :param Hashable td_cls: The type hint of the object.
         :param object obj: The object to cache.
         :param bool is_valid: The validity of the object.
+        :param set[type[Any]] | None noncachable_types: Types of objects that should not be cached.
+        :param Hashable variant: The validation options that affect validity (see :attr:`Options.cache_variant`).
         """
         log.debug("add_cache_entry: Caching object of type '%s' with id %d as valid=%s",
                   td_cls, id(obj), is_valid)
@@ -109,9 +133,40 @@ class ValidationCache:
             log.debug("add_cache_entry: Not caching object of type '%s' as it is in noncachable_types",
                       td_cls)
             return
-        item = CacheEntry(td_cls, obj, is_valid, self._cache, self._cache_lock)
+        if td_cls is None:  # None is a special case, replace with NoneType instead
+            td_cls = NoneType  # type: ignore[assignment]
+        bucket_key: tuple[Hashable, Hashable] = (td_cls, variant)
+        key: int = id(obj)
         with self._cache_lock:
-            self._cache.setdefault(item.cache_key, item)
+            bucket = self._cache.get(bucket_key)
+            if bucket is not None and key in bucket:
+                return
+
+            def cleanup(ref: weakref.ReferenceType[Any]) -> None:
+                """Cleanup callback for when the cached object is garbage collected.
+
+                :param weakref.ReferenceType[Any] ref: The weak reference to the cached object.
+                """
+                with self._cache_lock:
+                    current = self._cache.get(bucket_key)
+                    if current is not None and (cached := current.get(key)) is not None and cached.ref is ref:
+                        del current[key]
+                        self._size -= 1
+                        if not current:
+                            del self._cache[bucket_key]
+                            self._last = (_NO_HINT, None, {})
+
+            try:
+                entry = CacheEntry(obj, is_valid, cleanup)
+            except TypeError:
+                log.debug("add_cache_entry: Not caching object of type '%s' as it cannot be weakly referenced",
+                          type(obj).__name__)
+                return
+            if bucket is None:
+                bucket = self._cache[bucket_key] = {}
+                self._last = (_NO_HINT, None, {})  # may still name a deleted bucket for this key
+            bucket[key] = entry
+            self._size += 1
         self.trim_cache(self._max_cache_size)
 
     def trim_cache(self, size: int) -> None:
@@ -132,12 +187,12 @@ class ValidationCache:
         :raises TypeError: If size is not an integer.
         :raises ValueError: If size is less than 1.
         """
-        log.debug("trim_cache: Cache size %d. Trimming cache to size %d", len(self._cache), size)
-
         with self._cache_lock:
-            if len(self._cache) <= size:
+            if self._size <= size:
                 return
 
+        log.debug("trim_cache: Cache size %d. Trimming cache to size %d", self._size, size)
+
         if not isinstance(size, int):
             raise TypeError('Cache size must be an integer.')
 
@@ -147,15 +202,32 @@ class ValidationCache:
 
         with self._cache_lock:
             target_size = max(int(size * 0.75), 2)  # backstopped at 2 to prevent exceptions
-            while len(self._cache) > target_size:
-                self._cache.popitem(last=False)
-        log.debug("trim_cache: Cache trimmed to size %d", len(self._cache))
+            # Buckets are visited oldest first and their oldest entries removed first
+            for bucket_key in list(self._cache):
+                if self._size <= target_size:
+                    break
+                bucket = self._cache[bucket_key]
+                excess = self._size - target_size
+                if len(bucket) <= excess:
+                    self._size -= len(bucket)
+                    bucket.clear()
+                    del self._cache[bucket_key]
+                    self._last = (_NO_HINT, None, {})
+                else:
+                    for key in list(bucket)[:excess]:
+                        del bucket[key]
+                    self._size -= excess
+        log.debug("trim_cache: Cache trimmed to size %d", self._size)
 
     def clear(self) -> None:
         """Clear the entire cache."""
         log.debug("clear_cache: Clearing entire cache")
         with self._cache_lock:
+            for bucket in self._cache.values():
+                bucket.clear()  # pending cleanup callbacks must not find their entries
             self._cache.clear()
+            self._size = 0
+            self._last = (_NO_HINT, None, {})
 
     def get_cache_size(self) -> int:
         """Get the current size of the cache.
@@ -164,4 +236,4 @@ class ValidationCache:
         """
         log.debug("get_cache_size: Getting current cache size")
         with self._cache_lock:
-            return len(self._cache)
+            return self._size
@@ -1,84 +1,59 @@
 """Cache entry for validation results."""
-import threading
 import weakref
-from collections import OrderedDict
-from collections.abc import Hashable
+from collections.abc import Callable
 from typing import Any
 
-from ._cache_key import CacheKey
 
-
-class ObjectWrapper:
-    """A wrapper to allow weak references to any object.
-
-    :property Any obj: The wrapped object.
-    """
-    __slots__ = ("obj", "__weakref__")
-
-    def __init__(self, obj: Any):
-        """Initialize the ObjectWrapper.
-
-        :param Any obj: The object to wrap.
-        """
-        self.obj = obj
+def _none_ref() -> None:
+    """Stand-in for a weak reference to ``None``, which cannot be weakly referenced."""
+    return None
 
 
 class CacheEntry:
     """Cache entry for validation results.
 
-    :param Hashable td_cls: The type associated with the cached object.
-    :property object obj: The object having its validity cached.
+    The cached object is held by a weak reference, so the entry never keeps it alive
+    and ``cleanup`` is called when it is garbage collected. ``None`` is the only
+    object cached without a weak reference; it lives for the life of the interpreter.
+    Objects that cannot be weakly referenced (e.g. ``int``, ``tuple``, ``frozenset``,
+    or classes using ``__slots__`` without ``__weakref__``) cannot be cached.
+
+    :property Callable[[], Any] ref: Returns the cached object, or None if it has been garbage collected.
     :property bool is_valid: Whether the object is valid.
-    :property CacheKey cache_key: The cache key for the cached object.
     """
+    __slots__ = ("_ref", "_is_valid")
+
     def __init__(self,
-                 td_cls: Hashable,
                  obj: object,
                  is_valid: bool,
-                 cache: OrderedDict[CacheKey, "CacheEntry"],
-                 lock: threading.RLock) -> None:
+                 cleanup: Callable[[weakref.ReferenceType[Any]], None]) -> None:
         """Initialize the CacheEntry.
 
-        :param ImmutableCoreDataTypes value: The immutable core data type value.
-        :param bool is_valid: Whether the value is valid according to the TypedDict subclass.
+        :param object obj: The object having its validity cached.
+        :param bool is_valid: Whether the object is valid for the type hint it is cached under.
+        :param Callable[[weakref.ReferenceType[Any]], None] cleanup: Callback for when the cached
+            object is garbage collected. It is passed the weak reference.
+        :raises TypeError: If the object is not None and cannot be weakly referenced.
         """
-        cache_key = CacheKey(td_cls, obj)
-        self._cache_key: CacheKey = cache_key
+        self._ref: Callable[[], Any] = _none_ref if obj is None else weakref.ref(obj, cleanup)
         self._is_valid: bool = is_valid
 
-        def cleanup(ref: weakref.ReferenceType[ObjectWrapper]) -> None:  # pylint: disable=unused-argument
-            """Cleanup callback for when the cached object is garbage collected.
-
-            :param weakref.ReferenceType[object] ref: The weak reference to the cached object.
-            """
-            with lock:
-                if cache_key in cache:
-                    del cache[cache_key]
-
-        self._value: weakref.ReferenceType[ObjectWrapper] = weakref.ref(ObjectWrapper(obj), cleanup)
-
     @property
-    def obj_wrapper(self) -> ObjectWrapper | None:
-        """Get the cached wrapper object.
-
-        The returned object may be None if it has been garbage collected.
-        If the object is still alive, it is wrapped in an ObjectWrapper and the real object
-        can be accessed via the `obj` attribute of the wrapper.
+    def ref(self) -> Callable[[], Any]:
+        """Get the reference to the cached object.
 
-        This allows weak referencing of any object, even those that do not support weak references directly
-        or `None` values.
+        Calling the reference returns the cached object, or None if it has been garbage collected.
+        Because ``None`` itself can be cached, compare the result to the object being looked up
+        by identity rather than testing it for None.
 
         .. code-block:: python
 
-            cached_entry = cache_entry.obj_wrapper
-            if cached_entry is not None:
-                real_obj = cached_entry.obj
-            else:
-                # The cached object has been garbage collected
+            if cache_entry.ref() is obj:
+                valid = cache_entry.is_valid
 
-        :return ObjectWrapper | None: The wrapper to the cached object or None if it has been garbage collected.
+        :return Callable[[], Any]: The reference to the cached object.
         """
-        return self._value()
+        return self._ref
 
     @property
     def is_valid(self) -> bool:
@@ -87,11 +62,3 @@ class CacheEntry:
         :return bool: True if the object is valid, False otherwise.
         """
         return self._is_valid
-
-    @property
-    def cache_key(self) -> CacheKey:
-        """Get the cache key of the cached value.
-
-        :return CacheKey: The cache key of the cached value.
-        """
-        return self._cache_key
@@ -10,7 +10,7 @@ class ValidationCacheErrorTag(ErrorTag):
     """Error tags for report element validation errors."""
 
     NONE_VALUE_NOT_ALLOWED = "NONE_VALUE_NOT_ALLOWED"
-    """The value provided to create a CacheKey was None."""
+    """A None value was provided where one is not allowed."""
 
     INVALID_CACHE_SIZE = "INVALID_CACHE_SIZE"
     """The provided cache size is invalid."""
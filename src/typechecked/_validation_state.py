@@ -1,7 +1,7 @@
 """Validation state for type hint validation."""
 from typing import Any, NamedTuple
 
-__all__ = ('ValidationState',)
+__all__ = ('ValidationState', 'ValidationChain', '_in_chain', '_push_new_state', '_push_state')
 
 
 class ValidationState(NamedTuple):
@@ -17,3 +17,64 @@ class ValidationState(NamedTuple):
     """The type hint being checked against."""
     context: str
     """The context of the validation check."""
+
+
+class ValidationChain(NamedTuple):
+    """Immutable linked list of parent validation states for cycle detection.
+
+    Each link holds one state and the link of its parent, so descending into
+    a child allocates one small tuple instead of copying every ancestor state.
+    The root of a validation has no chain (``None``).
+
+    :property ValidationState state: The validation state for this level.
+    :property ValidationChain | None parent: The chain of parent states, or None at the root.
+    :property int depth: The number of states in the chain, including this one.
+    """
+    state: ValidationState
+    """The validation state for this level."""
+    parent: 'ValidationChain | None'
+    """The chain of parent states, or None at the root."""
+    depth: int
+    """The number of states in the chain, including this one."""
+
+
+def _push_state(chain: ValidationChain | None, state: ValidationState) -> ValidationChain:
+    """Add a validation state to the front of a chain.
+
+    Like adding to a set, a state already present in the chain is not added again
+    so that the chain depth matches the number of distinct parent states.
+
+    :param ValidationChain | None chain: The current chain of parent states.
+    :param ValidationState state: The validation state to add.
+    :return ValidationChain: The new chain with the state added.
+    """
+    if chain is not None and _in_chain(chain, state):
+        return chain
+    return ValidationChain(state, chain, 1 if chain is None else chain.depth + 1)
+
+
+def _push_new_state(chain: ValidationChain | None, state: ValidationState) -> ValidationChain:
+    """Add a validation state known not to be in a chain to the front of the chain.
+
+    Skips the membership check of :func:`_push_state` for callers that have
+    already checked that the state is not in the chain.
+
+    :param ValidationChain | None chain: The current chain of parent states.
+    :param ValidationState state: The validation state to add. Must not already be in the chain.
+    :return ValidationChain: The new chain with the state added.
+    """
+    return ValidationChain(state, chain, 1 if chain is None else chain.depth + 1)
+
+
+def _in_chain(chain: ValidationChain | None, state: ValidationState) -> bool:
+    """Check if a validation state is present in a chain.
+
+    :param ValidationChain | None chain: The chain of parent states.
+    :param ValidationState state: The validation state to look for.
+    :return bool: True if the state is in the chain, False otherwise.
+    """
+    while chain is not None:
+        if chain.state == state:
+            return True
+        chain = chain.parent
+    return False
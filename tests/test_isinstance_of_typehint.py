@@ -1,8 +1,10 @@
 """Tests for type hint validation functions."""
 # pylint: disable=import-error,wrong-import-position,unused-import,too-many-lines
 import enum
+import gc
 import logging
 import sys
+import weakref
 from collections.abc import Collection, Hashable, Iterable, Mapping, Sequence, Set
 from types import MappingProxyType
 from typing import (
@@ -22,7 +24,9 @@ from typing import (
 import pytest
 from testspec import Assert, TestAction, TestSpec, idspec
 
-from typechecked import clear_typechecked_cache, isinstance_of_typehint
+from typechecked import TypeCheckError, clear_typechecked_cache, isinstance_of_typehint
+from typechecked._options import Options
+from typechecked._typechecked import _check_instance_of_typehint
 
 if sys.version_info >= (3, 11):
     from typing import Never, NotRequired, Required
@@ -832,6 +836,37 @@ def test_nested_types(testspec: TestSpec) -> None:
     testspec.run()
 
 
+def depth_testspecs() -> list[TestSpec]:
+    """Test the depth limit for nested structures."""
+    testspecs: list[TestSpec] = [
+        idspec('DEPTH_001', TestAction(
+            name="[[1], ['a']] is not a list[list[int]] with default depth",
+            action=isinstance_of_typehint,
+            args=[[[1], ['a']], list[list[int]]],
+            assertion=Assert.FALSE)),
+        idspec('DEPTH_002', TestAction(
+            name="[[1], ['a']] is a list[list[int]] when depth stops before the inner items",
+            action=isinstance_of_typehint,
+            args=[[[1], ['a']], list[list[int]]],
+            kwargs={'depth': 4},
+            assertion=Assert.TRUE)),
+        idspec('DEPTH_003', TestAction(
+            name="[[1], ['a']] is not a list[list[int]] when depth reaches the inner items",
+            action=isinstance_of_typehint,
+            args=[[[1], ['a']], list[list[int]]],
+            kwargs={'depth': 5},
+            assertion=Assert.FALSE)),
+    ]
+    return testspecs
+
+
+@pytest.mark.parametrize('testspec', depth_testspecs())
+def test_depth(testspec: TestSpec) -> None:
+    """Test depth limit."""
+    clear_typechecked_cache()
+    testspec.run()
+
+
 def enum_testspecs() -> list[TestSpec]:
     """Test Enum type hints."""
 
@@ -1562,5 +1597,78 @@ def test_notrequired_typehint(testspec: TestSpec) -> None:
     testspec.run()
 
 
+def _raised_message(obj: Any, type_hint: Any) -> str:
+    """Check obj against type_hint with raise_on_error and return the error message."""
+    try:
+        _check_instance_of_typehint(obj, type_hint, Options(depth=10), None, raise_on_error=True, context='root')
+    except TypeCheckError as err:
+        return str(err)
+    return ''
+
+
+@pytest.mark.parametrize('testspec', [
+    idspec('PRIMITIVE_FAST_001', TestAction(
+        name='bad dict value falls back to the per-item check and its error message',
+        action=_raised_message, args=[{'a': 1, 'b': 'x'}, dict[str, int]],
+        expected="Object of type 'str' does not match primitive type hint '<class 'int'>'",
+        assertion=Assert.IN)),
+    idspec('PRIMITIVE_FAST_002', TestAction(
+        name='bad dict key falls back to the per-item check and its error message',
+        action=_raised_message, args=[{'a': 1, 2: 3}, dict[str, int]],
+        expected="Object of type 'int' does not match primitive type hint '<class 'str'>'",
+        assertion=Assert.IN)),
+    idspec('PRIMITIVE_FAST_003', TestAction(
+        name='bad list item falls back to the per-item check and its error message',
+        action=_raised_message, args=[[1, 'x'], list[int]],
+        expected="Item 'x' in Sequence does not match type hint '<class 'int'>'",
+        assertion=Assert.IN)),
+    idspec('PRIMITIVE_FAST_004', TestAction(
+        name='dict with a primitive key hint and a non-primitive value hint checks each value',
+        action=isinstance_of_typehint, args=[{'a': 1.5}, dict[str, int | str]],
+        expected=False)),
+    idspec('PRIMITIVE_FAST_005', TestAction(
+        name='dict with primitive key and value hints passes the fast path',
+        action=isinstance_of_typehint, args=[{'a': 1, 'b': 2}, dict[str, int]],
+        expected=True)),
+])
+def test_primitive_item_fast_path(testspec: TestSpec) -> None:
+    """Test containers of primitive type hints, which are checked with a fast path before per-item checks."""
+    clear_typechecked_cache()
+    testspec.run()
+
+
+def _runtime_origins_alive(count: int, clear: bool) -> int:
+    """Validate C[int] for count list subclasses created at runtime.
+
+    :return int: The number of the subclasses still alive afterwards.
+    """
+    clear_typechecked_cache()
+    refs = []
+    for index in range(count):
+        cls: Any = type(f'RuntimeList{index}', (list,), {})
+        isinstance_of_typehint(cls([1]), cls[int])
+        refs.append(weakref.ref(cls))
+    del cls
+    if clear:
+        clear_typechecked_cache()
+    gc.collect()
+    return sum(ref() is not None for ref in refs)
+
+
+@pytest.mark.parametrize('testspec', [
+    idspec('DISPATCH_CACHE_001', TestAction(
+        name='dispatch cache keeps at most 1024 runtime origins alive',
+        action=_runtime_origins_alive, args=[1100, False],
+        expected=1024)),
+    idspec('DISPATCH_CACHE_002', TestAction(
+        name='clear_typechecked_cache() releases all runtime origins',
+        action=_runtime_origins_alive, args=[50, True],
+        expected=0)),
+])
+def test_dispatch_cache_bounded(testspec: TestSpec) -> None:
+    """Test that origins dispatched to collections.abc checkers are not kept alive without bound."""
+    testspec.run()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, "--log-cli-level=INFO", '-s'])
@@ -0,0 +1,188 @@
+"""Tests for the validation cache."""
+# pylint: disable=import-error
+import gc
+import logging
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, TypedDict
+from unittest.mock import patch
+
+import pytest
+from testspec import TestAction, TestSpec, idspec
+
+from typechecked import Immutable, clear_typechecked_cache, isinstance_of_typehint
+from typechecked._cache import _CACHE
+from typechecked._options import Options
+from typechecked._validation_cache import ValidationCache
+
+log = logging.getLogger(__name__)
+
+
+class Weakrefable:
+    """A plain user-defined class (supports weak references)."""
+
+
+@dataclass(frozen=True)
+class FrozenPoint:
+    """A frozen dataclass (immutable and supports weak references)."""
+    x: int
+
+
+class ImmutableThing(Immutable):
+    """An Immutable subclass (supports weak references)."""
+
+
+class FrozenMap(Mapping[str, Any], Immutable):
+    """An immutable Mapping that is not a dict."""
+
+    def __init__(self, **items: Any) -> None:
+        self._items = dict(items)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._items.items()))
+
+
+class PointDict(TypedDict):
+    """A TypedDict that FrozenMap(x=1) matches unless strict_typed_dict is set."""
+    x: int
+
+
+def _lookup_after_add(obj: object, variant: object = None) -> bool | None:
+    """Add a valid entry for obj with variant False and look it up with the given variant."""
+    cache = ValidationCache()
+    hint: Any = type(obj)
+    cache.add_cache_entry(hint, obj, True, variant=False)
+    return cache.valid_in_cache(hint, obj, variant=variant)
+
+
+def _size_after_collect() -> tuple[int, int]:
+    """Add an entry for an object and look it up, then collect the object.
+
+    :return tuple[int, int]: The cache size and the number of type hint buckets after collection.
+    """
+    cache = ValidationCache()
+    obj = Weakrefable()
+    cache.add_cache_entry(Weakrefable, obj, True)
+    cache.valid_in_cache(Weakrefable, obj)
+    del obj
+    gc.collect()
+    return cache.get_cache_size(), len(cache._cache)  # pylint: disable=protected-access
+
+
+def _checked_twice(obj: object, type_hint: Any) -> tuple[bool, bool | None, bool]:
+    """Check obj twice, the second time with cache misses failing.
+
+    :return tuple[bool, bool | None, bool]: The first result, the cached result and the second result.
+    """
+    clear_typechecked_cache()
+    first = isinstance_of_typehint(obj, type_hint)
+    cached = _CACHE.valid_in_cache(type_hint, obj, variant=Options().cache_variant)
+    with patch('typechecked._typechecked._check_generic', side_effect=AssertionError('not served from cache')):
+        second = isinstance_of_typehint(obj, type_hint)
+    return first, cached, second
+
+
+def _past_depth_limit_after_cached(obj: object, type_hint: Any) -> tuple[bool, bool]:
+    """Check [obj] with its item past the depth limit, before and after obj's result is cached."""
+    clear_typechecked_cache()
+    cold = isinstance_of_typehint([obj], list[type_hint], depth=1)
+    isinstance_of_typehint(obj, type_hint)
+    return cold, isinstance_of_typehint([obj], list[type_hint], depth=1)
+
+
+def _lax_then_strict(obj: object, type_hint: Any) -> tuple[bool, bool]:
+    """Check obj without and then with strict_typed_dict."""
+    clear_typechecked_cache()
+    return (isinstance_of_typehint(obj, type_hint),
+            isinstance_of_typehint(obj, type_hint, strict_typed_dict=True))
+
+
+def _size_after_trim(count: int) -> int:
+    """Add entries spread over two type hints to a cache with a maximum size of 200."""
+    cache = ValidationCache(min_cache_size=100, max_cache_size=200)
+    objs = [Weakrefable() for _ in range(count)]
+    for index, obj in enumerate(objs):
+        cache.add_cache_entry(Weakrefable if index % 2 else object, obj, True)
+    return cache.get_cache_size()
+
+
+@pytest.mark.parametrize('testspec', [
+    idspec('CACHE_TRIM_001', TestAction(
+        name="cache is not trimmed at the maximum size",
+        action=_size_after_trim, args=[200],
+        expected=200)),
+    idspec('CACHE_TRIM_002', TestAction(
+        name="cache is trimmed to 75% of the maximum size when it exceeds it",
+        action=_size_after_trim, args=[201],
+        expected=150)),
+])
+def test_trim_cache(testspec: TestSpec) -> None:
+    """Test trimming of ValidationCache across type hint buckets."""
+    testspec.run()
+
+
+@pytest.mark.parametrize('testspec', [
+    idspec('CACHE_ENTRY_001', TestAction(
+        name="weakly referenceable object is found after being added",
+        action=_lookup_after_add, args=[Weakrefable()], kwargs={'variant': False},
+        expected=True)),
+    idspec('CACHE_ENTRY_002', TestAction(
+        name="entry is not found under a different variant",
+        action=_lookup_after_add, args=[Weakrefable()], kwargs={'variant': True},
+        expected=None)),
+    idspec('CACHE_ENTRY_003', TestAction(
+        name="None is cached",
+        action=_lookup_after_add, args=[None], kwargs={'variant': False},
+        expected=True)),
+    idspec('CACHE_ENTRY_004', TestAction(
+        name="object that cannot be weakly referenced is not cached",
+        action=_lookup_after_add, args=[tuple(range(10))], kwargs={'variant': False},
+        expected=None)),
+    idspec('CACHE_ENTRY_005', TestAction(
+        name="entry and its emptied bucket are removed when its object is garbage collected",
+        action=_size_after_collect,
+        expected=(0, 0))),
+])
+def test_cache_entries(testspec: TestSpec) -> None:
+    """Test adding and looking up ValidationCache entries."""
+    testspec.run()
+
+
+@pytest.mark.parametrize('testspec', [
+    idspec('CACHED_CHECK_001', TestAction(
+        name="valid frozen dataclass is served from the cache",
+        action=_checked_twice, args=[FrozenPoint(1), FrozenPoint],
+        expected=(True, True, True))),
+    idspec('CACHED_CHECK_002', TestAction(
+        name="valid Immutable subclass is served from the cache",
+        action=_checked_twice, args=[ImmutableThing(), ImmutableThing],
+        expected=(True, True, True))),
+    idspec('CACHED_CHECK_003', TestAction(
+        name="invalid frozen dataclass is served from the cache",
+        action=_checked_twice, args=[FrozenPoint(1), ImmutableThing],
+        expected=(False, False, False))),
+    idspec('CACHED_CHECK_004', TestAction(
+        name="cached TypedDict result is not reused with strict_typed_dict",
+        action=_lax_then_strict, args=[FrozenMap(x=1), PointDict],
+        expected=(True, False))),
+    idspec('CACHED_CHECK_005', TestAction(
+        name="cached TypedDict item result is not reused with strict_typed_dict",
+        action=_lax_then_strict, args=[(FrozenMap(x=1),), tuple[PointDict, ...]],
+        expected=(True, False))),
+    idspec('CACHED_CHECK_006', TestAction(
+        name="cached invalid result is not used for an item past the depth limit",
+        action=_past_depth_limit_after_cached, args=[FrozenPoint(1), ImmutableThing],
+        expected=(True, True))),
+])
+def test_cached_checks(testspec: TestSpec) -> None:
+    """Test that cacheable validation results are cached and reused only with the same options."""
+    testspec.run()